@@ -0,0 +1,10 @@
+"""
+Builds the optional compiled kernel used by simpy4.py:
+
+    python setup_kernel.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(ext_modules=cythonize("simulate_kernel.pyx"))
@@ -1,46 +1,62 @@
 """
-This script simulates the progression of multiple assets through a single development phase using SimPy.
+This script simulates the progression of multiple assets through a single development phase using NumPy.
 Each asset is initialized at a random time within a 52-week window, enters the phase, and after the phase duration,
-its success or failure is determined probabilistically. The simulation prints the timing and outcome for each asset.
+its success or failure is determined probabilistically. Since every asset just waits out a fixed duration with no
+resources or interactions, the timings are closed-form (start + duration) and the outcomes one batch of Bernoulli
+draws, so no event loop is needed. The per-event lines are logged at DEBUG level; raise the logging level to
+silence them at effectively zero cost. The simulation prints the timing and outcome for each asset.
 """
 
-import simpy
-import random
+import numpy as np
+import logging
 
 NUM_ASSETS = 10
 PHASE = "ph1"
 PHASE_DURATION = 52  # weeks
 SUCCESS_PROB = 0.5
 
-
-def asset_process(env, asset_id, results):
-    # Asset is initialized at a random time (0-52 weeks)
-    start_time = random.uniform(0, PHASE_DURATION)
-    yield env.timeout(start_time)
-    print(f"Asset {asset_id} initialized at week {env.now:.1f}")
-    print(f"Asset {asset_id} enters {PHASE} at week {env.now:.1f}")
-    yield env.timeout(PHASE_DURATION)
-    # Determine success
-    success = random.random() < SUCCESS_PROB
-    outcome = "SUCCESS" if success else "FAILURE"
-    print(f"Asset {asset_id} completed {PHASE} at week {env.now:.1f} with {outcome}")
-    results[asset_id] = {
-        "start_time": start_time,
-        "end_time": env.now,
-        "outcome": outcome
-    }
+log = logging.getLogger(__name__)
 
 
 def run_simulation(num_assets):
-    env = simpy.Environment()
+    rng = np.random.default_rng()
+    # Assets are initialized at random times (0-52 weeks); end times and
+    # outcomes follow directly from one batch of draws
+    start_times = rng.uniform(0, PHASE_DURATION, num_assets)
+    end_times = start_times + PHASE_DURATION
+    successes = rng.random(num_assets) < SUCCESS_PROB
+
+    # Collect the event lines lazily as (time, format, args) tuples; nothing
+    # is formatted unless DEBUG logging is actually enabled
+    verbose = log.isEnabledFor(logging.DEBUG)
+    events = []
     results = {}
-    for asset_id in range(1, num_assets + 1):
-        env.process(asset_process(env, asset_id, results))
-    env.run()
+    for i in range(num_assets):
+        asset_id = i + 1
+        outcome = "SUCCESS" if successes[i] else "FAILURE"
+        if verbose:
+            events.append((start_times[i], "Asset %d initialized at week %.1f", asset_id, start_times[i]))
+            events.append((start_times[i], "Asset %d enters %s at week %.1f", asset_id, PHASE, start_times[i]))
+            events.append((end_times[i], "Asset %d completed %s at week %.1f with %s", asset_id, PHASE, end_times[i], outcome))
+        results[asset_id] = {
+            "start_time": start_times[i],
+            "end_time": end_times[i],
+            "outcome": outcome
+        }
+
+    # Replay the log in event order, as the event loop would have emitted it
+    if verbose:
+        events.sort(key=lambda e: e[0])
+        for event in events:
+            log.debug(event[1], *event[2:])
+
     return results
 
 if __name__ == "__main__":
+    import sys
+    # Per-event lines go to DEBUG; switch to level=logging.WARNING to drop them
+    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG, format="%(message)s")
     results = run_simulation(NUM_ASSETS)
     print("\nSimulation Results:")
     for asset_id, info in results.items():
-        print(f"Asset {asset_id}: Started at week {info['start_time']:.1f}, Ended at week {info['end_time']:.1f}, Outcome: {info['outcome']}") 
\ No newline at end of file
+        print(f"Asset {asset_id}: Started at week {info['start_time']:.1f}, Ended at week {info['end_time']:.1f}, Outcome: {info['outcome']}")
@@ -1,16 +1,21 @@
 """
-This script simulates the progression of multiple assets through a multi-phase development pipeline using SimPy.
+This script simulates the progression of multiple assets through a multi-phase development pipeline using NumPy.
 Each asset is initialized at a random time within a 52-week window (based on the Ph1 phase duration), then proceeds
 sequentially through a series of phases (ID1, ID2, Ph1, Ph2A, Ph2B, Ph3, File). Each phase has a defined duration
-and probability of success. If an asset fails a phase, it does not proceed to subsequent phases. The simulation
+and probability of success. If an asset fails a phase, it does not proceed to subsequent phases. The phases are
+strictly sequential with deterministic durations, so the whole pipeline reduces to cumulative duration sums and a
+batch of Bernoulli draws with a cumulative product to propagate failure — no event loop needed. The per-event
+lines are logged at DEBUG level; raise the logging level to silence them at effectively zero cost. The simulation
 prints the timing and outcome for each asset at each phase, and summarizes the results at the end.
 """
 
-import simpy
-import random
+import numpy as np
+import logging
 
 NUM_ASSETS = 10
 
+log = logging.getLogger(__name__)
+
 # Define phase names and parameters
 PHASES = [
     {"name": "ID1",   "duration": 10,  "success_prob": 0.95},
@@ -22,42 +27,62 @@ PHASES = [
     {"name": "File",  "duration": 26,  "success_prob": 0.9},
 ]
 
-def asset_trajectory(env, asset_id, results):
-    # Asset is initialized at a random time (0-52 weeks)
-    start_time = random.uniform(0, PHASES[2]["duration"])  # Use Ph1 duration for randomization
-    yield env.timeout(start_time)
-    print(f"Asset {asset_id} initialized at week {env.now:.1f}")
-    phase_results = {}
-    current_time = env.now
-    success = True
-
-    for idx, phase in enumerate(PHASES):
-        if not success:
-            break
-        print(f"Asset {asset_id} enters {phase['name']} at week {env.now:.1f}")
-        yield env.timeout(phase["duration"])
-        success = random.random() < phase["success_prob"]
-        outcome = "SUCCESS" if success else "FAILURE"
-        print(f"Asset {asset_id} completed {phase['name']} at week {env.now:.1f} with {outcome}")
-        phase_results[phase["name"]] = {
-            "start_time": current_time,
-            "end_time": env.now,
-            "outcome": outcome
-        }
-        current_time = env.now
-        # Example: If you want to branch at Ph2A/Ph2B, you can add logic here
+def run_simulation(num_assets):
+    num_phases = len(PHASES)
+    durations = np.array([p["duration"] for p in PHASES], dtype=np.float64)
+    probs = np.array([p["success_prob"] for p in PHASES])
 
-    results[asset_id] = phase_results
+    rng = np.random.default_rng()
+    # Assets are initialized at random times (0-52 weeks); use Ph1 duration for randomization
+    starts = rng.uniform(0, PHASES[2]["duration"], num_assets)
+    # One Bernoulli draw per asset per phase; an asset reaches a phase only if
+    # all earlier phases succeeded (shifted cumulative product along the phase axis)
+    successes = rng.random((num_assets, num_phases)) < probs
+    reached = np.ones((num_assets, num_phases), dtype=bool)
+    reached[:, 1:] = np.cumprod(successes[:, :-1], axis=1)
+    # Phase start/end times are the start time plus the cumulative phase
+    # durations (exclusive/inclusive of the current phase)
+    cum_dur = np.cumsum(durations)
+    phase_starts = starts[:, None] + np.concatenate(([0.0], cum_dur[:-1]))[None, :]
+    end_times = starts[:, None] + cum_dur[None, :]
 
-def run_simulation(num_assets):
-    env = simpy.Environment()
+    # Collect the event lines lazily as (time, format, args) tuples; nothing
+    # is formatted unless DEBUG logging is actually enabled
+    verbose = log.isEnabledFor(logging.DEBUG)
+    events = []
     results = {}
-    for asset_id in range(1, num_assets + 1):
-        env.process(asset_trajectory(env, asset_id, results))
-    env.run()
+    for i in range(num_assets):
+        asset_id = i + 1
+        if verbose:
+            events.append((starts[i], "Asset %d initialized at week %.1f", asset_id, starts[i]))
+        phase_results = {}
+        for idx, phase in enumerate(PHASES):
+            if not reached[i, idx]:
+                break
+            outcome = "SUCCESS" if successes[i, idx] else "FAILURE"
+            if verbose:
+                events.append((phase_starts[i, idx], "Asset %d enters %s at week %.1f", asset_id, phase["name"], phase_starts[i, idx]))
+                events.append((end_times[i, idx], "Asset %d completed %s at week %.1f with %s", asset_id, phase["name"], end_times[i, idx], outcome))
+            phase_results[phase["name"]] = {
+                "start_time": phase_starts[i, idx],
+                "end_time": end_times[i, idx],
+                "outcome": outcome
+            }
+            # Example: If you want to branch at Ph2A/Ph2B, you can add logic here
+        results[asset_id] = phase_results
+
+    # Replay the log in event order, as the event loop would have emitted it
+    if verbose:
+        events.sort(key=lambda e: e[0])
+        for event in events:
+            log.debug(event[1], *event[2:])
+
     return results
 
 if __name__ == "__main__":
+    import sys
+    # Per-event lines go to DEBUG; switch to level=logging.WARNING to drop them
+    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG, format="%(message)s")
     results = run_simulation(NUM_ASSETS)
     print("\nSimulation Results:")
     for asset_id, info in results.items():
@@ -68,4 +93,4 @@ if __name__ == "__main__":
                 p = info[pname]
                 print(f"  {pname}: Started at week {p['start_time']:.1f}, Ended at week {p['end_time']:.1f}, Outcome: {p['outcome']}")
             else:
-                break
\ No newline at end of file
+                break
@@ -9,6 +9,7 @@ for further analysis.
 
 import simpy
 import random
+import numpy as np
 import pandas as pd
 
 # Store important simulation details in a dictionary for easy access and reference
@@ -25,24 +26,34 @@ SIMULATION_DETAILS = {
     ]
 }
 
+# Structure-of-arrays view of the phase table, so the hot loop does indexed
+# array reads instead of a dict lookup per field per iteration
+PHASE_NAMES = np.array([p["name"] for p in SIMULATION_DETAILS["phases"]])
+PHASE_DUR = np.array([p["duration"] for p in SIMULATION_DETAILS["phases"]], dtype=np.int32)
+PHASE_PROB = np.array([p["success_prob"] for p in SIMULATION_DETAILS["phases"]], dtype=np.float64)
+NUM_PHASES = len(PHASE_NAMES)
+
 def asset_trajectory(env, asset_id, results, records):
     # Asset is initialized at a random time (0-52 weeks)
-    start_time = random.uniform(0, SIMULATION_DETAILS["phases"][2]["duration"])  # Use Ph1 duration for randomization
+    start_time = random.uniform(0, PHASE_DUR[2])  # Use Ph1 duration for randomization
     yield env.timeout(start_time)
     print(f"Asset {asset_id} initialized at week {env.now:.1f}")
     phase_results = {}
     current_time = env.now
     success = True
 
-    for idx, phase in enumerate(SIMULATION_DETAILS["phases"]):
+    for idx in range(NUM_PHASES):
         if not success:
             break
-        print(f"Asset {asset_id} enters {phase['name']} at week {env.now:.1f}")
-        yield env.timeout(phase["duration"])
-        success = random.random() < phase["success_prob"]
+        name = PHASE_NAMES[idx]
+        duration = PHASE_DUR[idx]
+        prob = PHASE_PROB[idx]
+        print(f"Asset {asset_id} enters {name} at week {env.now:.1f}")
+        yield env.timeout(duration)
+        success = random.random() < prob
         outcome = "SUCCESS" if success else "FAILURE"
-        print(f"Asset {asset_id} completed {phase['name']} at week {env.now:.1f} with {outcome}")
-        phase_results[phase["name"]] = {
+        print(f"Asset {asset_id} completed {name} at week {env.now:.1f} with {outcome}")
+        phase_results[name] = {
             "start_time": current_time,
             "end_time": env.now,
             "outcome": outcome
@@ -50,10 +61,10 @@ def asset_trajectory(env, asset_id, results, records):
         # Store all important simulation information in a table (list of dicts)
         records.append({
             "asset_id": asset_id,
-            "phase": phase["name"],
+            "phase": name,
             "phase_idx": idx,
-            "phase_duration": phase["duration"],
-            "phase_success_prob": phase["success_prob"],
+            "phase_duration": duration,
+            "phase_success_prob": prob,
             "phase_start_time": current_time,
             "phase_end_time": env.now,
             "phase_outcome": outcome,
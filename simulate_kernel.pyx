@@ -0,0 +1,49 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled inner loop for simpy4: one C call runs every replication and writes
+the records straight into the caller's preallocated column arrays, with the
+GIL released for the whole simulation. Build in place with:
+
+    python setup_kernel.py build_ext --inplace
+"""
+
+from libc.stdint cimport int32_t, uint8_t
+
+cdef extern from "stdlib.h" nogil:
+    double drand48()
+    void srand48(long seedval)
+
+
+cpdef simulate(long num_replications, long num_assets,
+               double[::1] durations, double[::1] probs,
+               double init_window, long seed,
+               int32_t[::1] rep_arr, int32_t[::1] asset_arr, int32_t[::1] phase_arr,
+               double[::1] start_arr, double[::1] end_arr,
+               uint8_t[::1] outcome_arr, double[::1] init_arr, uint8_t[::1] valid_arr):
+    cdef long rep, a, base, k
+    cdef int p
+    cdef int num_phases = durations.shape[0]
+    cdef double start, t, t_end
+    cdef bint success
+    srand48(seed)
+    with nogil:
+        for rep in range(num_replications):
+            for a in range(num_assets):
+                start = drand48() * init_window
+                t = start
+                base = (rep * num_assets + a) * num_phases
+                for p in range(num_phases):
+                    t_end = t + durations[p]
+                    success = drand48() < probs[p]
+                    k = base + p
+                    rep_arr[k] = rep + 1
+                    asset_arr[k] = a + 1
+                    phase_arr[k] = p
+                    start_arr[k] = t
+                    end_arr[k] = t_end
+                    outcome_arr[k] = success
+                    init_arr[k] = start
+                    valid_arr[k] = True
+                    t = t_end
+                    if not success:
+                        break